@@ -0,0 +1,78 @@
+import hashlib
+import sqlite3
+import time
+from . import data
+
+
+class Cache:
+    def __init__(self, file_name: str, max_entries: int = 100000, max_age: int = 30 * 24 * 60 * 60):
+        self.MAX_ENTRIES = max_entries
+        self.MAX_AGE = max_age
+        # eviction walks the atime index, so run it once per this many inserts instead of every run
+        self.EVICT_EVERY = 1000
+        # refresh atime of a hit at most this often, so most hits stay read only
+        self.TOUCH_AGE = 60 * 60
+        self.VERSION = self.__tool_version()
+        # a broken, locked or foreign cache file only means results get recomputed
+        try:
+            self.db = sqlite3.connect(file_name)
+            # a lost write only costs a recompute, so don't wait for fsync
+            self.db.execute("PRAGMA synchronous = OFF")
+            self.db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, result TEXT NOT NULL, atime REAL NOT NULL)")
+            self.db.execute("CREATE INDEX IF NOT EXISTS results_atime ON results (atime)")
+        except sqlite3.Error:
+            self.db = None
+
+    @staticmethod
+    def __tool_version() -> str:
+        # results are only valid for the Data code that computed them
+        # and for the __encode format they were stored in
+        digest = hashlib.sha256()
+        for file_name in (data.__file__, __file__):
+            with open(file_name, "rb") as f:
+                digest.update(f.read())
+        return digest.hexdigest()[:16]
+
+    def key(self, file_data: bytes) -> str:
+        return "{version}:{digest}".format(version=self.VERSION, digest=hashlib.sha256(file_data).hexdigest())
+
+    def get(self, key: str):
+        if self.db is None:
+            return None
+        try:
+            row = self.db.execute("SELECT result, atime FROM results WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if row[1] < now - self.TOUCH_AGE:
+                self.db.execute("UPDATE results SET atime = ? WHERE key = ?", (now, key))
+                self.db.commit()
+        except sqlite3.Error:
+            return None
+        return self.__decode(row[0])
+
+    def put(self, key: str, result):
+        if self.db is None:
+            return
+        try:
+            cursor = self.db.execute("INSERT OR REPLACE INTO results (key, result, atime) VALUES (?, ?, ?)",
+                    (key, self.__encode(result), time.time()))
+            if cursor.lastrowid % self.EVICT_EVERY == 0:
+                self.__evict()
+            self.db.commit()
+        except sqlite3.Error:
+            return
+
+    def __evict(self):
+        self.db.execute("DELETE FROM results WHERE atime < ?", (time.time() - self.MAX_AGE,))
+        self.db.execute("DELETE FROM results WHERE atime < (SELECT atime FROM results ORDER BY atime DESC LIMIT 1 OFFSET ?)",
+                (self.MAX_ENTRIES - 1,))
+
+    @staticmethod
+    def __encode(result) -> str:
+        # tables split by "|", sectors by ";" and blocks by " ", cheaper to load than json
+        return "|".join([";".join([" ".join(sector) for sector in table]) for table in result])
+
+    @staticmethod
+    def __decode(result: str):
+        return [[sector.split(" ") for sector in table.split(";")] for table in result.split("|")]
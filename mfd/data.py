@@ -0,0 +1,270 @@
+import codecs
+import sys
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .cache import Cache
+
+
+class Data:
+    def __init__(self):
+        self.UID_LEN = 8
+        self.BCC_LEN = 2
+        self.SAK_LEN = 2
+        self.ATQA_LEN = 4
+        self.edited = False
+        return
+
+    def read_dump(self, file_name: str, cache: 'Cache' = None):
+        self.file_name = file_name
+        self.blocks = []
+        with open(self.file_name, "rb") as f:
+            file_data = f.read()
+
+        data_size = len(file_data)
+
+        if data_size not in {320, 1024, 4096}:
+            sys.exit("Wrong file size: %d bytes.\nOnly 320, 1024 or 4096 bytes allowed." % len(file_data))
+
+        sector_number = 0
+        start = 0
+        end = 64
+
+        while True:
+            sector = file_data[start:end]
+            sector = codecs.encode(sector, 'hex')
+            if not isinstance(sector, str):
+                sector = str(sector, 'ascii')
+            sectors = [sector[x:x + 32] for x in range(0, len(sector), 32)]
+
+            self.blocks.append(sectors)
+
+            sector_number += 1
+            if sector_number < 32:
+                start += 64
+                end += 64
+            elif sector_number == 32:
+                start += 64
+                end += 256
+            else:
+                start += 256
+                end += 256
+
+            if start == data_size:
+                break
+        f.closed
+
+        if cache is None:
+            self.__fill_acc()
+            self.__check_data()
+            return
+
+        key = cache.key(file_data)
+        result = cache.get(key)
+        if result is not None and self.__valid_result(result):
+            self.acc, self.acc_err, self.data_warn = result
+            return
+
+        # a miss or a damaged row, which put() overwrites
+        self.__fill_acc()
+        self.__check_data()
+        cache.put(key, [self.acc, self.acc_err, self.data_warn])
+
+    def __valid_result(self, result) -> bool:
+        # a cached result needs one entry per block and only values Data itself produces
+        acc_values = {"ERR"} | {"{:03b}".format(i) for i in range(0, 8)}
+        if len(result) != 3:
+            return False
+        for table, values in zip(result, [acc_values, {"OK", "ERR"}, {"OK", "WARN"}]):
+            if len(table) != len(self.blocks):
+                return False
+            for s in range(0, len(self.blocks)):
+                if len(table[s]) != len(self.blocks[s]):
+                    return False
+                if not all(value in values for value in table[s]):
+                    return False
+        return True
+
+    def __fill_acc(self):
+        self.acc = []
+        for s in range(0, len(self.blocks)):
+            acc_bytes = int(self.blocks[s][len(self.blocks[s]) - 1][12:20], 16)
+            acc_bits = []
+            if len(self.blocks[s]) == 4:
+                for i in range(0, 4):
+                    acc_bits.append(self.__decode_acc_bytes_to_bits_per_block(acc_bytes, i))
+            elif len(self.blocks[s]) == 16:
+                for i in range(0, 4):
+                    for j in range(0, 5):
+                        if (i * 5 + j >= len(self.blocks[s])):
+                            break
+                        acc_bits.append(self.__decode_acc_bytes_to_bits_per_block(acc_bytes, i))
+            self.acc.append(acc_bits)
+        self.__fill_acc_err()
+
+    def __fill_acc_err(self):
+        self.acc_err = []
+        for s in range(0, len(self.blocks)):
+            acc_bits_err = []
+            for b in range(0, len(self.blocks[s])):
+                acc_bits_err.append("OK" if self.acc[s][b].isdigit() else "ERR")
+            self.acc_err.append(acc_bits_err)
+
+    @staticmethod
+    def __acc_bit(acc_bytes: int, index: int) -> int:
+        # index counts from the most significant bit, like the ACC bytes are written
+        return (acc_bytes >> (31 - index)) & 1
+
+    @staticmethod
+    def __set_acc_bit(acc_bytes: int, index: int, value: int) -> int:
+        mask = 1 << (31 - index)
+        return acc_bytes | mask if value else acc_bytes & ~mask
+
+    @staticmethod
+    def __decode_acc_bytes_to_bits_per_block(acc_bytes: int, block_index: int) -> str:
+        bits = "{}{}{}".format(
+                Data.__acc_bit(acc_bytes, 11 - block_index),
+                Data.__acc_bit(acc_bytes, 23 - block_index),
+                Data.__acc_bit(acc_bytes, 19 - block_index))
+        inverted = "{}{}{}".format(
+                1 - Data.__acc_bit(acc_bytes, 7 - block_index),
+                1 - Data.__acc_bit(acc_bytes, 3 - block_index),
+                1 - Data.__acc_bit(acc_bytes, 15 - block_index))
+
+        if bits == inverted:
+            return bits
+        else:
+            return "ERR"
+
+    def __check_data(self):
+        self.data_warn = []
+        for s in range(0, len(self.blocks)):
+            self.data_warn.append([])
+            for b in range(0, len(self.blocks[s]) - 1):
+                if self.acc[s][b] in ["000", "001", "110"]:
+                    if s == 0 and b == 0:
+                        self.data_warn[s].append("OK")
+                    else:
+                        self.data_warn[s].append(self.__check_block(self.blocks[s][b]))
+                else:
+                    self.data_warn[s].append("OK")
+            self.data_warn[s].append("OK")
+
+    @staticmethod
+    def __check_block(block: str) -> str:
+        value = int(block[0:8], 16)
+        value_inverted = int(block[8:16], 16) ^ 0xffffffff
+        value_repeat = int(block[16:24], 16)
+
+        addr = int(block[24:26], 16)
+        addr_inverted = int(block[26:28], 16) ^ 0xff
+        addr_repeat = int(block[28:30], 16)
+        addr_inverted_repeat = int(block[30:32], 16) ^ 0xff
+
+        if value != value_inverted:
+            return "WARN"
+        if value != value_repeat:
+            return "WARN"
+        if addr != addr_inverted:
+            return "WARN"
+        if addr != addr_repeat:
+            return "WARN"
+        if addr != addr_inverted_repeat:
+            return "WARN"
+        return "OK"
+
+    def update_acc_bit(self, s: int, b: int, index: int, c: chr):
+        acc_list = list(self.acc[s][b])
+        acc_list[index] = c
+        self.acc[s][b] = "".join(acc_list)
+        self.__update_blocks_from_acc(s, b, index)
+        self.__fill_acc_err()
+        self.__check_data()
+
+    def __update_blocks_from_acc(self, s: int, b: int, index: int):
+        if len(self.blocks[s]) == 4:
+            self.__update_accbytes_from_accbits(s, b, index)
+        elif len(self.blocks[s]) == 16:
+            self.__update_accbytes_from_accbits(s, b // 5, index)
+
+    def __update_accbytes_from_accbits(self, s: int, b: int, index: int):
+        acc_bytes = int(self.blocks[s][len(self.blocks[s]) - 1][12:20], 16)
+
+        if index == 0:
+            acc_bytes = self.__set_acc_bit(acc_bytes, 11 - b, ord(self.acc[s][b][0]) - ord('0'))
+            acc_bytes = self.__set_acc_bit(acc_bytes, 7 - b, not ord(self.acc[s][b][0]) - ord('0'))
+        elif index == 1:
+            acc_bytes = self.__set_acc_bit(acc_bytes, 23 - b, ord(self.acc[s][b][1]) - ord('0'))
+            acc_bytes = self.__set_acc_bit(acc_bytes, 3 - b, not ord(self.acc[s][b][1]) - ord('0'))
+        elif index == 2:
+            acc_bytes = self.__set_acc_bit(acc_bytes, 19 - b, ord(self.acc[s][b][2]) - ord('0'))
+            acc_bytes = self.__set_acc_bit(acc_bytes, 15 - b, not ord(self.acc[s][b][2]) - ord('0'))
+
+        acc_hex = "%08x" % acc_bytes
+        block_list = list(self.blocks[s][len(self.blocks[s]) - 1])
+
+        for i in range(0, 8):
+            block_list[i+12] = acc_hex[i]
+        self.blocks[s][len(self.blocks[s]) - 1] = "".join(block_list)
+
+    def update_blocks_hex(self, s: int, b: int, index: int, c: chr):
+        block_list = list(self.blocks[s][b])
+        block_list[index] = c
+        self.blocks[s][b] = "".join(block_list)
+        if s == 0 and b == 0 and index in range(0, 8):
+            self.__update_bcc()
+        self.__fill_acc()
+        self.__check_data()
+        self.edited = True
+
+    def block_offset(self, s: int, b: int) -> int:
+        # nibble offset of the block from the beginning of the dump
+        offset = 0
+        for i in range(0, s):
+            offset += len(self.blocks[i]) * 32
+        return offset + b * 32
+
+    def read_hex(self, begin: int, end: int) -> str:
+        return "".join(["".join(sector) for sector in self.blocks])[begin:end]
+
+    def write_hex(self, begin: int, hex_str: str):
+        # one batched edit of many nibbles, validated once at the end
+        dump = list("".join(["".join(sector) for sector in self.blocks]))
+        end = min(begin + len(hex_str), len(dump))
+        if begin >= end:
+            return
+        dump[begin:end] = hex_str[:end - begin]
+
+        offset = 0
+        for s in range(0, len(self.blocks)):
+            for b in range(0, len(self.blocks[s])):
+                self.blocks[s][b] = "".join(dump[offset:offset + 32])
+                offset += 32
+
+        if begin < self.UID_LEN + self.BCC_LEN:
+            self.__update_bcc()
+        self.__fill_acc()
+        self.__check_data()
+        self.edited = True
+
+    def __update_bcc(self):
+        xor_current = self.blocks[0][0][0:2]
+        for i in range(2, self.UID_LEN, 2):
+            xor_current = self.__xor_str(xor_current, self.blocks[0][0][i:i+2])
+        block_list = list(self.blocks[0][0])
+        block_list[8] = xor_current[0]
+        block_list[9] = xor_current[1]
+        self.blocks[0][0] = "".join(block_list)
+
+    @staticmethod
+    def __xor_str(a: str, b: str) -> str:
+        return "".join(["%x" % (int(x,16) ^ int(y,16)) for (x, y) in zip(a, b)])
+
+    def save_dump(self):
+        with open(self.file_name, "wb") as f:
+            for s in range(0, len(self.blocks)):
+                for b in range(0, len(self.blocks[s])):
+                    f.write(codecs.decode(self.blocks[s][b].encode('ascii'), 'hex'))
+        f.closed
+        self.edited = False
+        return
@@ -0,0 +1,498 @@
+import curses
+import sys
+import time
+from typing import List
+from .data import Data
+from .view import View
+
+
+class TUI:
+    def __init__(self, view: View, data: Data):
+        self.__init_curses()
+        self.__init_coors(view)
+        self.__check_terminal()
+        self.__init_colors()
+        self.__init_objects()
+        self.__init_frame()
+        self.__init_clipboard()
+        self.__fill_objects(view, data)
+
+    def __init_curses(self):
+        self.stdscr = curses.initscr()
+        curses.start_color()
+        curses.noecho()
+        curses.cbreak()
+        curses.curs_set(1)
+        self.stdscr.keypad(True)
+
+    @staticmethod
+    def __bracketed_paste_mode(enable: bool):
+        # the terminal then wraps pasted text in ESC [200~ ... ESC [201~
+        sys.stdout.write("\033[?2004h" if enable else "\033[?2004l")
+        sys.stdout.flush()
+
+    def __init_coors(self, view: View):
+        self.PAD_MAIN_BEGIN_X, self.PAD_MAIN_BEGIN_Y = 0, 7
+        self.PAD_MAIN_SIZE_X, self.PAD_MAIN_SIZE_Y = view.COLS + 1, len(view.view)
+        self.PAD_MAIN_END_Y = min(len(view.view) - 1, curses.LINES - 3)
+        self.pad_pos_y = 0
+
+        self.CURSOR_POS_MIN_X, self.CURSOR_POS_MIN_Y = view.BLOCKS_BEGIN, self.PAD_MAIN_BEGIN_Y
+        self.CURSOR_POS_MAX_X, self.CURSOR_POS_MAX_Y = view.ACC_BITS_END - 1, self.PAD_MAIN_END_Y - self.PAD_MAIN_BEGIN_Y
+        self.cursor_pos_x, self.cursor_pos_y = self.CURSOR_POS_MIN_X, 0
+
+        self.MIN_LINES = 11
+
+    def __check_terminal(self):
+        if (curses.COLS < self.PAD_MAIN_SIZE_X - 1) or (curses.LINES < self.MIN_LINES):
+            curses.endwin()
+            sys.exit("Too small terminal (need {}x{} or bigger)".format(self.PAD_MAIN_SIZE_X - 1, self.MIN_LINES))
+
+    def __init_colors(self):
+        curses.init_pair(1, curses.COLOR_RED, curses.COLOR_BLACK)
+        curses.init_pair(2, curses.COLOR_GREEN, curses.COLOR_BLACK)
+        curses.init_pair(3, curses.COLOR_BLUE, curses.COLOR_BLACK)
+        curses.init_pair(4, curses.COLOR_BLACK, curses.COLOR_RED)
+        curses.init_pair(5, curses.COLOR_BLACK, curses.COLOR_YELLOW)
+        curses.init_pair(6, curses.COLOR_BLACK, curses.COLOR_WHITE)
+        curses.init_pair(7, curses.COLOR_YELLOW, curses.COLOR_BLACK)
+        curses.init_pair(8, curses.COLOR_CYAN, curses.COLOR_BLACK)
+        curses.init_pair(9, curses.COLOR_MAGENTA, curses.COLOR_BLACK)
+
+    def __init_objects(self):
+        self.win_header = curses.newwin(1, self.PAD_MAIN_SIZE_X, 0, 0)
+        self.win_splitter_header = curses.newwin(1, self.PAD_MAIN_SIZE_X, 1, 0)
+        self.pad_second_header = curses.newpad(4, self.PAD_MAIN_SIZE_X)
+        self.win_splitter_headerAndMain = curses.newwin(1, self.PAD_MAIN_SIZE_X, 6, 0)
+        self.pad_main = curses.newpad(self.PAD_MAIN_SIZE_Y, self.PAD_MAIN_SIZE_X)
+        self.win_splitter_footer = curses.newwin(1, self.PAD_MAIN_SIZE_X, curses.LINES - 2, 0)
+        self.win_footer = curses.newwin(1, self.PAD_MAIN_SIZE_X, curses.LINES - 1, 0)
+
+    def __init_frame(self):
+        self.FRAME_TIME = 1 / 30
+        self.last_frame = 0.0
+        self.pending_keys = []
+        self.view_dirty = False
+        self.windows_dirty = True
+        self.footer_dirty = True
+        self.pad_dirty = True
+        self.pad_drawn_y = -1
+
+    def __init_clipboard(self):
+        self.HELP = "H/J/K/L/Arrows/Home/End/PgUp/PgDown - Move; 0-F - Edit; V - Mark; Y/W - Copy; P - Paste; I - Fill; S - Save; Q - quit"
+        self.clipboard_kind, self.clipboard = "", ""
+        self.mark = -1
+        self.footer_text = ""
+
+    def __fill_objects(self, view: View, data: Data):
+        self.__legend_fill()
+        self.win_splitter_header.addstr(0, 0, view.line_fill())
+        for i in range(0, len(view.header_fill())):
+            self.pad_second_header.addstr(i, 0, view.header_fill()[i])
+        self.win_splitter_headerAndMain.addstr(0, 0, view.line_fill())
+        self.__pad_fill(view, data)
+        self.win_splitter_footer.addstr(0, 0, view.line_fill())
+        self.footer_text = ""
+        self.__footer_fill(self.HELP)
+        self.windows_dirty = True
+
+    def __pad_fill(self, view: View, data: Data):
+        for i in range(0, len(view.view)):
+            self.pad_main.addstr(i, 0, view.view[i])
+            skip, sector_trailer, manufacturer = view.check_raw(i)
+            if skip:
+                continue
+            self.__colored_acc_bits(view.view[i], i, view.ACC_BITS_BEGIN, view.ACC_BITS_END,
+                    data.acc_err[view.view_to_blocks[i]['s']][view.view_to_blocks[i]['b']])
+
+            if sector_trailer:
+                self.__colored_sector_trailer(view.view[i], i,
+                        view.KEY_A_BEGIN, view.KEY_A_END,
+                        view.ACC_BYTES_BEGIN, view.ACC_BYTES_END,
+                        view.KEY_B_BEGIN, view.KEY_B_END)
+            elif manufacturer:
+                self.__colored_manufacturer(view.view[i], i,
+                        view.BLOCKS_BEGIN, data.UID_LEN,
+                        data.BCC_LEN, data.SAK_LEN, data.ATQA_LEN)
+            else:
+                self.__colored_data(view.view[i], i, view.BLOCKS_BEGIN, view.BLOCKS_END,
+                    data.data_warn[view.view_to_blocks[i]['s']][view.view_to_blocks[i]['b']])
+        self.pad_dirty = True
+
+    def __colored_data(self, original: str, i: int, BLOCKS_BEGIN: int, BLOCKS_END: int, warn: str):
+        if warn == "WARN":
+            self.pad_main.addstr(i, BLOCKS_BEGIN, original[BLOCKS_BEGIN:BLOCKS_END], curses.color_pair(5))
+
+    def __colored_acc_bits(self, original:str , i: int, ACC_BITS_BEGIN: int, ACC_BITS_END: int, err: str):
+        if err == "OK":
+            self.pad_main.addstr(i, ACC_BITS_BEGIN, original[ACC_BITS_BEGIN:ACC_BITS_END], curses.color_pair(2))
+        elif err == "ERR":
+            self.pad_main.addstr(i, ACC_BITS_BEGIN, original[ACC_BITS_BEGIN:ACC_BITS_END], curses.color_pair(4))
+
+    def __colored_sector_trailer(self, original: str, i: int,
+            KEY_A_BEGIN: int, KEY_A_END: int,
+            ACC_BYTES_BEGIN: int, ACC_BYTES_END: int,
+            KEY_B_BEGIN: int, KEY_B_END: int):
+        self.pad_main.addstr(i, KEY_A_BEGIN, original[KEY_A_BEGIN:KEY_A_END], curses.color_pair(1))
+        self.pad_main.addstr(i, ACC_BYTES_BEGIN, original[ACC_BYTES_BEGIN:ACC_BYTES_END], curses.color_pair(2))
+        self.pad_main.addstr(i, KEY_B_BEGIN, original[KEY_B_BEGIN:KEY_B_END], curses.color_pair(3))
+
+    def __colored_manufacturer(self, original: str, i: int,
+            BLOCKS_BEGIN: int, UID_LEN: int, BCC_LEN: int, SAK_LEN: int, ATQA_LEN: int):
+        UID_BEGIN = BLOCKS_BEGIN
+        UID_END = UID_BEGIN + UID_LEN
+        BCC_BEGIN = UID_END
+        BCC_END = BCC_BEGIN + BCC_LEN
+        SAK_BEGIN = BCC_END
+        SAK_END = SAK_BEGIN + SAK_LEN
+        ATQA_BEGIN = SAK_END
+        ATQA_END = ATQA_BEGIN + ATQA_LEN
+        self.pad_main.addstr(i, UID_BEGIN, original[UID_BEGIN:UID_END], curses.color_pair(6))
+        self.pad_main.addstr(i, BCC_BEGIN, original[BCC_BEGIN:BCC_END], curses.color_pair(7))
+        self.pad_main.addstr(i, SAK_BEGIN, original[SAK_BEGIN:SAK_END], curses.color_pair(8))
+        self.pad_main.addstr(i, ATQA_BEGIN, original[ATQA_BEGIN:ATQA_END], curses.color_pair(9))
+
+    def __legend_fill(self):
+        self.win_header.addstr(0, 0, "| Legend: ")
+        self.win_header.addstr("UID", curses.color_pair(6))
+        self.win_header.addstr(", ")
+        self.win_header.addstr("BCC", curses.color_pair(7))
+        self.win_header.addstr(", ")
+        self.win_header.addstr("SAK", curses.color_pair(8))
+        self.win_header.addstr(", ")
+        self.win_header.addstr("ATQA", curses.color_pair(9))
+        self.win_header.addstr(", ")
+        self.win_header.addstr("Key A", curses.color_pair(1))
+        self.win_header.addstr(", ")
+        self.win_header.addstr("Access Bits", curses.color_pair(2))
+        self.win_header.addstr(", ")
+        self.win_header.addstr("Key B", curses.color_pair(3))
+        self.win_header.addstr(", ")
+        self.win_header.addstr("Warning", curses.color_pair(5))
+        self.win_header.addstr(", ")
+        self.win_header.addstr("Error", curses.color_pair(4))
+        self.win_header.addstr(' ' * 52 + '|')
+
+    def loop(self, stdscr, view: View, data: Data):
+        self.stdscr = stdscr
+        # switched off on every way out, or the shell keeps getting wrapped pastes
+        self.__bracketed_paste_mode(True)
+        try:
+            while True:
+                self.__refresh(view, data)
+
+                self.pending_keys += self.__read_keys()
+                while self.pending_keys:
+                    if not self.__handle_key(view, data):
+                        return
+        finally:
+            self.__bracketed_paste_mode(False)
+
+    def __read_keys(self) -> List[int]:
+        self.stdscr.nodelay(False)
+        keys = [self.stdscr.getch()]
+
+        # a held key or a paste keeps arriving until the next frame is due,
+        # so collect all of it and repaint once instead of once per key
+        wait = self.FRAME_TIME - (time.monotonic() - self.last_frame)
+        if wait > 0:
+            curses.napms(int(wait * 1000))
+
+        self.stdscr.nodelay(True)
+        c = self.stdscr.getch()
+        while c != -1:
+            keys.append(c)
+            c = self.stdscr.getch()
+        self.stdscr.nodelay(False)
+        return keys
+
+    def __getch(self) -> int:
+        if self.pending_keys:
+            return self.pending_keys.pop(0)
+        return self.stdscr.getch()
+
+    def __getch_nowait(self) -> int:
+        if self.pending_keys:
+            return self.pending_keys.pop(0)
+        self.stdscr.nodelay(True)
+        c = self.stdscr.getch()
+        self.stdscr.nodelay(False)
+        return c
+
+    def __refresh(self, view: View, data: Data):
+        if self.view_dirty:
+            view.sectors_fill(data)
+            self.__pad_fill(view, data)
+            self.view_dirty = False
+
+        if self.windows_dirty:
+            self.win_header.noutrefresh()
+            self.win_splitter_header.noutrefresh()
+            # maybe decrease last arg
+            self.pad_second_header.noutrefresh(0, 0, 2, 0, 5, self.PAD_MAIN_SIZE_X - 2)
+            self.win_splitter_headerAndMain.noutrefresh()
+            self.win_splitter_footer.noutrefresh()
+            self.windows_dirty = False
+
+        if self.footer_dirty:
+            self.win_footer.noutrefresh()
+            self.footer_dirty = False
+
+        if self.pad_dirty or self.pad_drawn_y != self.pad_pos_y:
+            # maybe decrease last arg
+            self.pad_main.noutrefresh(self.pad_pos_y, 0, self.PAD_MAIN_BEGIN_Y, self.PAD_MAIN_BEGIN_X, self.PAD_MAIN_END_Y, self.PAD_MAIN_SIZE_X - 2)
+            self.pad_drawn_y = self.pad_pos_y
+            self.pad_dirty = False
+
+        # stdscr goes last, so the terminal cursor ends up at the edit position
+        self.stdscr.move(self.cursor_pos_y + self.CURSOR_POS_MIN_Y, self.cursor_pos_x)
+        self.stdscr.noutrefresh()
+        curses.doupdate()
+        self.last_frame = time.monotonic()
+
+    def __handle_key(self, view: View, data: Data) -> bool:
+        c = self.__lower_char(self.__getch())
+        self.__footer_fill(self.__footer_status())
+        if c == ord('q'):
+            quit = self.__quit(view, data)
+            self.__fill_objects(view, data)
+            return not quit
+        elif c == curses.KEY_UP or c == ord('k'):
+            self.__move_y(-1, view)
+        elif c == curses.KEY_DOWN or c == ord('j'):
+            self.__move_y(1, view)
+        elif c == curses.KEY_LEFT or c == ord('h'):
+            self.__move_x(view.BLOCKS_END, view.ACC_BITS_BEGIN, -1)
+        elif c == curses.KEY_RIGHT or c == ord('l'):
+            self.__move_x(view.BLOCKS_END, view.ACC_BITS_BEGIN, 1)
+        elif c == curses.KEY_HOME:
+            self.cursor_pos_x = self.CURSOR_POS_MIN_X
+        elif c == curses.KEY_END:
+            self.cursor_pos_x = self.CURSOR_POS_MAX_X
+        elif c == curses.KEY_PPAGE:
+            self.__move_y(-self.CURSOR_POS_MAX_Y - 1, view)
+        elif c == curses.KEY_NPAGE:
+            self.__move_y(self.CURSOR_POS_MAX_Y + 1, view)
+        elif c in range(ord('0'), ord('9') + 1) or c in range(ord('a'), ord('f') + 1):
+            if self.__edit_hex(c, view, data):
+                self.__move_x(view.BLOCKS_END, view.ACC_BITS_BEGIN, 1)
+        elif c == ord('s'):
+            self.__save(view, data)
+            self.__fill_objects(view, data)
+        elif c == ord('v'):
+            self.__toggle_mark(view, data)
+        elif c == ord('y'):
+            self.__copy_block(view, data)
+        elif c == ord('w'):
+            self.__copy_sector(view, data)
+        elif c == ord('p'):
+            self.__paste_clipboard(view, data)
+        elif c == ord('i'):
+            self.__fill(view, data)
+        elif c == 27:
+            self.__paste_text(self.__read_bracketed_paste(), view, data)
+        return True
+
+    @staticmethod
+    def __lower_char(c: int) -> int:
+        if ord('A') <= c <= ord('Z'):
+            return c - ord('A') + ord('a')
+        else:
+            return c
+
+    def __footer_fill(self, message: str):
+        if message == self.footer_text:
+            return
+        self.footer_text = message
+        self.win_footer.addstr(0, 0, "| {message: <121} |".format(message=message))
+        self.footer_dirty = True
+
+    def __footer_status(self) -> str:
+        if self.mark == -1:
+            return self.HELP
+        return "Mark at block {block} nibble {nibble}; Y - Copy; I - Fill; V - Unmark".format(
+                block=self.mark // 32, nibble=self.mark % 32)
+
+    def __quit(self, view: View, data: Data) -> bool:
+        if data.edited:
+            return self.__bool_dialog("Are you sure to exit (edit will be lost)?", view, data)
+        return True
+
+    def __bool_dialog(self, message: str, view: View, data: Data) -> bool:
+        self.win_footer.addstr(0, 0, "| ")
+        self.win_footer.addstr("{message: <121}".format(message=message + " (Y/n):"), curses.A_BLINK)
+        self.win_footer.addstr(" |")
+        self.footer_text = message
+        self.footer_dirty = True
+        self.__refresh(view, data)
+        c = self.__lower_char(self.__getch())
+        while True:
+            if c == ord('y'):
+                return True
+            elif c == ord('n'):
+                return False
+            c = self.__lower_char(self.__getch())
+
+    def __move_y(self, add: int, view: View):
+        future_abs_pos_y = self.cursor_pos_y + self.pad_pos_y + add
+        skip, sector_trailer, manufacturer = view.check_raw(future_abs_pos_y)
+        if skip:
+            self.__add_pos_y(add + (1 if add > 0 else -1))
+            return
+        self.__add_pos_y(add)
+
+    def __add_pos_y(self, add: int):
+        if self.cursor_pos_y + add < 0:
+            while add < 0:
+                if self.cursor_pos_y + self.pad_pos_y == 0:
+                    break
+                self.pad_pos_y -= 1
+                add += 1
+            if add < 0:
+                self.cursor_pos_y, self.pad_pos_y = 0, 0
+            return
+        elif self.cursor_pos_y + add > self.CURSOR_POS_MAX_Y:
+            scrolled = False
+            while add > 0:
+                if self.CURSOR_POS_MAX_Y + self.pad_pos_y + 1 == self.PAD_MAIN_SIZE_Y:
+                    break
+                self.pad_pos_y += 1
+                add -= 1
+                scrolled = True
+            if add > 0:
+                if not scrolled:
+                    self.cursor_pos_y = self.CURSOR_POS_MAX_Y
+            return
+        self.cursor_pos_y += add
+
+    def __move_x(self, BLOCKS_END: int, ACC_BITS_BEGIN:int, add: int):
+        future_abs_pos_x = self.cursor_pos_x + add
+        if future_abs_pos_x < self.CURSOR_POS_MIN_X:
+            return
+        elif future_abs_pos_x > self.CURSOR_POS_MAX_X:
+            return
+        elif future_abs_pos_x in range(BLOCKS_END, ACC_BITS_BEGIN):
+            self.cursor_pos_x += add * 6
+            return
+        self.cursor_pos_x += add
+
+    def __edit_hex(self, c: int, view: View, data: Data) -> bool:
+        if self.cursor_pos_x in range(view.ACC_BITS_BEGIN, view.ACC_BITS_END):
+            if c not in range(ord('0'), ord('1') + 1):
+                return False
+            else:
+                # maybe need use list
+                data.update_acc_bit(view.view_to_blocks[self.cursor_pos_y + self.pad_pos_y]['s'],
+                        view.view_to_blocks[self.cursor_pos_y + self.pad_pos_y]['b'],
+                        self.cursor_pos_x - view.ACC_BITS_BEGIN, chr(c))
+        elif self.cursor_pos_x in range(view.BLOCKS_BEGIN, view.BLOCKS_END):
+            if self.cursor_pos_y + self.pad_pos_y == 0:
+                if self.cursor_pos_x in range(view.BLOCKS_BEGIN + 8, view.BLOCKS_BEGIN + 10):
+                    return False
+            data.update_blocks_hex(view.view_to_blocks[self.cursor_pos_y + self.pad_pos_y]['s'],
+                    view.view_to_blocks[self.cursor_pos_y + self.pad_pos_y]['b'],
+                    self.cursor_pos_x - view.BLOCKS_BEGIN, chr(c))
+
+        self.view_dirty = True
+
+        return True
+
+    def __cursor_nibble(self, view: View, data: Data) -> int:
+        if self.cursor_pos_x not in range(view.BLOCKS_BEGIN, view.BLOCKS_END):
+            return -1
+        block = self.__cursor_block(view)
+        return data.block_offset(block['s'], block['b']) + self.cursor_pos_x - view.BLOCKS_BEGIN
+
+    def __cursor_block(self, view: View) -> dict:
+        return view.view_to_blocks[self.cursor_pos_y + self.pad_pos_y]
+
+    def __selected_range(self, view: View, data: Data):
+        # marked nibbles up to the cursor, or the whole block under the cursor
+        cursor = self.__cursor_nibble(view, data)
+        if self.mark != -1 and cursor != -1:
+            return "range", min(self.mark, cursor), max(self.mark, cursor) + 1
+        block = self.__cursor_block(view)
+        begin = data.block_offset(block['s'], block['b'])
+        return "block", begin, begin + 32
+
+    def __toggle_mark(self, view: View, data: Data):
+        if self.mark != -1:
+            self.mark = -1
+        else:
+            self.mark = self.__cursor_nibble(view, data)
+        self.__footer_fill(self.__footer_status())
+
+    def __copy_block(self, view: View, data: Data):
+        self.clipboard_kind, begin, end = self.__selected_range(view, data)
+        self.clipboard = data.read_hex(begin, end)
+        self.mark = -1
+        self.__footer_fill("Copied {kind} of {count} nibbles".format(kind=self.clipboard_kind, count=len(self.clipboard)))
+
+    def __copy_sector(self, view: View, data: Data):
+        s = self.__cursor_block(view)['s']
+        begin = data.block_offset(s, 0)
+        self.clipboard_kind = "sector"
+        self.clipboard = data.read_hex(begin, begin + len(data.blocks[s]) * 32)
+        self.__footer_fill("Copied sector {sector} of {count} nibbles".format(sector=s, count=len(self.clipboard)))
+
+    def __paste_clipboard(self, view: View, data: Data):
+        block = self.__cursor_block(view)
+        if self.clipboard_kind == "block":
+            begin = data.block_offset(block['s'], block['b'])
+        elif self.clipboard_kind == "sector":
+            if len(self.clipboard) != len(data.blocks[block['s']]) * 32:
+                self.__footer_fill("Can't paste sector into sector {sector} of another size".format(sector=block['s']))
+                return
+            begin = data.block_offset(block['s'], 0)
+        elif self.clipboard_kind == "range":
+            begin = self.__cursor_nibble(view, data)
+        else:
+            return
+        self.__write_hex(begin, self.clipboard, data)
+
+    def __fill(self, view: View, data: Data):
+        _, begin, end = self.__selected_range(view, data)
+        self.mark = -1
+        self.__footer_fill("Fill {count} nibbles with (0-F):".format(count=end - begin))
+        self.__refresh(view, data)
+        c = chr(self.__lower_char(self.__getch()))
+        if c not in "0123456789abcdef":
+            self.__footer_fill(self.HELP)
+            return
+        self.__write_hex(begin, c * (end - begin), data)
+
+    def __read_bracketed_paste(self) -> str:
+        consumed = []
+        for expected in "[200~":
+            c = self.__getch_nowait()
+            if c == -1:
+                break
+            consumed.append(c)
+            if c != ord(expected):
+                break
+        if consumed != [ord(c) for c in "[200~"]:
+            # not a paste after all, so the keys after ESC are handled as usual
+            self.pending_keys[:0] = consumed
+            return ""
+        text = ""
+        while not text.endswith("\033[201~"):
+            text += chr(self.__getch())
+        return text[:-len("\033[201~")]
+
+    def __paste_text(self, text: str, view: View, data: Data):
+        hex_str = "".join([c for c in text.lower() if c in "0123456789abcdef"])
+        if not hex_str:
+            return
+        self.__write_hex(self.__cursor_nibble(view, data), hex_str, data)
+
+    def __write_hex(self, begin: int, hex_str: str, data: Data):
+        if begin == -1:
+            return
+        data.write_hex(begin, hex_str)
+        self.view_dirty = True
+        self.__footer_fill("Wrote {count} nibbles at block {block} nibble {nibble}".format(
+                count=len(hex_str), block=begin // 32, nibble=begin % 32))
+
+    def __save(self, view: View, data: Data):
+        if self.__bool_dialog("Are you sure to save dump?", view, data):
+            data.save_dump()
@@ -0,0 +1,225 @@
+from typing import List
+from .data import Data
+
+
+class View:
+    def __init__(self, data: Data):
+        self.COLS = 125
+        self.BLOCKS_BEGIN = 19
+        self.BLOCKS_END = 51
+        self.KEY_A_BEGIN = self.BLOCKS_BEGIN
+        self.ACC_BYTES_BEGIN = 31
+        self.KEY_B_BEGIN = 39
+        self.KEY_A_END = self.ACC_BYTES_BEGIN
+        self.ACC_BYTES_END = self.KEY_B_BEGIN
+        self.KEY_B_END = self.BLOCKS_END
+        self.ACC_BITS_BEGIN = 56
+        self.ACC_BITS_END = 59
+        self.sectors_fill(data)
+
+    def sectors_fill(self, data: Data):
+        self.view = []
+        self.view_to_blocks = []
+        block_number = 0
+        for s in range(0, len(data.blocks)):
+            blocks_count = len(data.blocks[s])
+            for b in range(0, len(data.blocks[s])):
+                if s == 0 and b == 0:
+                    acc_help_for_block_view = "manufacturer block"
+                elif b != blocks_count - 1:
+                    acc_help_for_block_view = self.__acc_help_per_block_data(data.acc[s][b])
+                else:
+                    acc_help_for_block_view = self.__acc_help_per_block_sector_trailer(data.acc[s][b])
+
+                if b == 2:
+                    s_view = s
+                else:
+                    s_view = ''
+
+                self.view.append("|{sector: >5}   |{block: >5}  | {block_data} |   {acc}  | {acc_help: <61}|".format(
+                    sector=s_view,
+                    block=block_number,
+                    block_data=data.blocks[s][b],
+                    acc=data.acc[s][b],
+                    acc_help=acc_help_for_block_view
+                    )
+                    )
+                self.view_to_blocks.append({'s': s, 'b': b})
+                block_number += 1
+
+            if s < (len(data.blocks) - 1):
+                self.view.append(self.line_fill())
+                self.view_to_blocks.append({'s': -1, 'b': -1})
+
+    @staticmethod
+    def __acc_help_per_block_data(acc: str) -> str:
+        permissions = {
+            '000': " A/B  |  A/B  |  A/B  |  A/B  | all all (transport mode)",
+            '001': " A/B  |   -   |   -   |  A/B  | read and d/t/r all",
+            '010': " A/B  |   -   |   -   |   -   | read all",
+            '011': "   B  |   B   |   -   |   -   | read and write B only",
+            '100': " A/B  |   B   |   -   |   -   | read all and write B only",
+            '101': "   B  |   -   |   -   |   -   | read only B",
+            '110': " A/B  |   B   |   B   |  A/B  | read and d/t/r all, w/i B",
+            '111': "  -   |   -   |   -   |   -   | none",
+        }
+        if acc.isdigit():
+            return permissions.get(acc, "unknown")
+        else:
+            return ""
+
+    @staticmethod
+    def __acc_help_per_block_sector_trailer(acc: str) -> str:
+        permissions = {
+            '000': "- | A | A | - | A | A | read all by A and write B by A",
+            '001': "- | A | A | A | A | A | all all by A (transport mode)",
+            '010': "- | - | A | - | A | - | read ACC and B by A",
+            '011': "- | B |A/B| B | - | B | read ACC by all and write all by B",
+            '100': "- | B |A/B| - | - | B | read ACC by all and write keys by B",
+            '101': "- | - |A/B| B | - | - | read ACC by all and write ACC by B",
+            '110': "- | - |A/B| - | - | - | read ACC by all",
+            '111': "- | - |A/B| - | - | - | read ACC by all",
+        }
+        if acc.isdigit():
+            return permissions.get(acc, "unknown")
+        else:
+            return ""
+
+    def line_fill(self) -> str:
+        return ('-' * self.COLS)
+
+    @staticmethod
+    def header_fill() -> List[str]:
+        return [
+            "| Sector | Block |               Data               | Access | Access bits help                                             |",
+            "|        |       |                                  |        |   r   |   w   |   i   | d/t/r | operations for data block    |",
+            "|        |       |                                  |        | Key A |  ACC  | Key B | operation on part of sector trailer  |",
+            "|        |       |                                  |        | r | w | r | w | r | w | operation for part of sector trailer |"
+        ]
+
+    def check_raw(self, index: int):
+        if index < 160:
+            if (index + 1) % 5 == 0:
+                return True, False, False
+            elif (index + 1) % 5 == 4:
+                return False, True, False
+            elif index == 0:
+                return False, False, True
+        else:
+            if index % 17 == 6:
+                return True, False, False
+            elif index % 17 == 5:
+                return False, True, False
+        return False, False, False
+
+
+class Bash:
+    def __init__(self):
+        self.RED = '\033[31m'
+        self.GREEN = '\033[32m'
+        self.BLUE = '\033[34m'
+        self.PURPLE = '\033[35m'
+        self.CYAN = '\033[36m'
+        self.YELLOW = '\033[33m'
+        self.INVERSE = '\033[47;30m'
+        self.ERROR = '\033[41;30m'
+        self.WARNING = '\033[43;30m'
+        self.ENDC = '\033[0m'
+        self.colored_view = []
+
+    def print(self, view: View, data: Data):
+        self.__colored(view, data)
+        print(self.__legend_fill())
+        print(view.line_fill())
+        for i in range(0, len(view.header_fill())):
+            print(view.header_fill()[i])
+        print(view.line_fill())
+        for i in range(0, len(self.colored_view)):
+            print(self.colored_view[i])
+        print(view.line_fill())
+
+    def __legend_fill(self):
+        return "| Legeng: " + \
+                self.INVERSE + "UID" + self.ENDC + ", " + \
+                self.YELLOW + "BCC" + self.ENDC + ", " + \
+                self.CYAN + "SAK" + self.ENDC + ", " + \
+                self.PURPLE + "ATQA" + self.ENDC + ", " + \
+                self.RED + "Key A" + self.ENDC + ", " + \
+                self.GREEN + "Access Bits" + self.ENDC + ", " + \
+                self.BLUE + "Key B" + self.ENDC + ", " + \
+                self.WARNING + "Warning" + self.ENDC + ", " + \
+                self.ERROR + "Error" + self.ENDC + \
+                ' ' * 52 + '|'
+
+    def __colored(self, view: View, data: Data):
+        for i in range(0, len(view.view)):
+            self.colored_view.append(view.view[i])
+            skip, sector_trailer, manufacturer = view.check_raw(i)
+            if skip:
+                continue
+            self.__colored_acc_bits(i,
+                data.acc_err[view.view_to_blocks[i]['s']][view.view_to_blocks[i]['b']],
+                view.ACC_BITS_BEGIN, view.ACC_BITS_END)
+
+            if sector_trailer:
+                self.__colored_sector_trailer(i, view.KEY_A_BEGIN, view.KEY_A_END,
+                        view.ACC_BYTES_BEGIN, view.ACC_BYTES_END, view.KEY_B_BEGIN, view.KEY_B_END)
+            elif manufacturer:
+                self.__colored_manufacturer(i,
+                        view.BLOCKS_BEGIN, data.UID_LEN,
+                        data.BCC_LEN, data.SAK_LEN, data.ATQA_LEN)
+            else:
+                self.__colored_data(i,
+                        data.data_warn[view.view_to_blocks[i]['s']][view.view_to_blocks[i]['b']],
+                        view.BLOCKS_BEGIN, view.BLOCKS_END)
+
+    def __colored_acc_bits(self, index: int, err: str, ACC_BITS_BEGIN: int, ACC_BITS_END: int):
+        if err == "OK":
+            self.colored_view[index] = self.colored_view[index][:ACC_BITS_BEGIN] + \
+                self.GREEN + self.colored_view[index][ACC_BITS_BEGIN:ACC_BITS_END] + \
+                self.ENDC + self.colored_view[index][ACC_BITS_END:]
+        elif err == "ERR":
+            self.colored_view[index] = self.colored_view[index][:ACC_BITS_BEGIN] + \
+                self.ERROR + self.colored_view[index][ACC_BITS_BEGIN:ACC_BITS_END] + \
+                self.ENDC + self.colored_view[index][ACC_BITS_END:]
+
+    def __colored_sector_trailer(self, index: int, KEY_A_BEGIN: int, KEY_A_END: int, ACC_BYTES_BEGIN: int, ACC_BYTES_END: int,
+            KEY_B_BEGIN: int, KEY_B_END: int):
+        self.colored_view[index] = self.colored_view[index][:KEY_B_BEGIN] + \
+                self.BLUE + self.colored_view[index][KEY_B_BEGIN:KEY_B_END] + \
+                self.ENDC + self.colored_view[index][KEY_B_END:]
+        self.colored_view[index] = self.colored_view[index][:ACC_BYTES_BEGIN] + \
+                self.GREEN + self.colored_view[index][ACC_BYTES_BEGIN:ACC_BYTES_END] + \
+                self.ENDC + self.colored_view[index][ACC_BYTES_END:]
+        self.colored_view[index] = self.colored_view[index][:KEY_A_BEGIN] + \
+                self.RED + self.colored_view[index][KEY_A_BEGIN:KEY_A_END] + \
+                self.ENDC + self.colored_view[index][KEY_A_END:]
+
+    def __colored_manufacturer(self, index: int,
+            BLOCKS_BEGIN: int, UID_LEN: int, BCC_LEN: int, SAK_LEN: int, ATQA_LEN: int):
+        UID_BEGIN = BLOCKS_BEGIN
+        UID_END = UID_BEGIN + UID_LEN
+        BCC_BEGIN = UID_END
+        BCC_END = BCC_BEGIN + BCC_LEN
+        SAK_BEGIN = BCC_END
+        SAK_END = SAK_BEGIN + SAK_LEN
+        ATQA_BEGIN = SAK_END
+        ATQA_END = ATQA_BEGIN + ATQA_LEN
+        self.colored_view[index] = self.colored_view[index][:ATQA_BEGIN] + \
+                self.PURPLE + self.colored_view[index][ATQA_BEGIN:ATQA_END] + \
+                self.ENDC + self.colored_view[index][ATQA_END:]
+        self.colored_view[index] = self.colored_view[index][:SAK_BEGIN] + \
+                self.CYAN + self.colored_view[index][SAK_BEGIN:SAK_END] + \
+                self.ENDC + self.colored_view[index][SAK_END:]
+        self.colored_view[index] = self.colored_view[index][:BCC_BEGIN] + \
+                self.YELLOW + self.colored_view[index][BCC_BEGIN:BCC_END] + \
+                self.ENDC + self.colored_view[index][BCC_END:]
+        self.colored_view[index] = self.colored_view[index][:UID_BEGIN] + \
+                self.INVERSE + self.colored_view[index][UID_BEGIN:UID_END] + \
+                self.ENDC + self.colored_view[index][UID_END:]
+
+    def __colored_data(self, index: int, data_warn: str, BLOCKS_BEGIN: int, BLOCKS_END: int):
+        if data_warn == "WARN":
+            self.colored_view[index] = self.colored_view[index][:BLOCKS_BEGIN] + \
+                self.WARNING + self.colored_view[index][BLOCKS_BEGIN:BLOCKS_END] + \
+                self.ENDC + self.colored_view[index][BLOCKS_END:]
@@ -0,0 +1,126 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mfd.cache import Cache
+from mfd.data import Data
+
+RESULT = [[["000", "ERR"], ["001"]], [["OK", "ERR"], ["OK"]], [["OK", "WARN"], ["OK"]]]
+
+
+class CacheTestCase(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.dir.cleanup)
+        self.db_name = os.path.join(self.dir.name, "cache.db")
+        self.dump_name = os.path.join(self.dir.name, "dump.mfd")
+        dump = bytearray(1024)
+        for s in range(0, 16):
+            dump[s * 64 + 48:s * 64 + 64] = bytes.fromhex("ffffffffffffff078069ffffffffffff")
+        with open(self.dump_name, "wb") as f:
+            f.write(dump)
+
+    def keys(self, cache: Cache) -> set:
+        return {row[0] for row in cache.db.execute("SELECT key FROM results")}
+
+    def test_miss_then_hit(self):
+        cache = Cache(self.db_name)
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", RESULT)
+        self.assertEqual(cache.get("k"), RESULT)
+        self.assertEqual(Cache(self.db_name).get("k"), RESULT)
+
+    def test_read_dump_uses_cached_result(self):
+        cache = Cache(self.db_name)
+        computed = Data()
+        computed.read_dump(self.dump_name, cache)
+        self.assertEqual(len(self.keys(cache)), 1)
+
+        cached = Data()
+        cached.read_dump(self.dump_name, Cache(self.db_name))
+        self.assertEqual((cached.acc, cached.acc_err, cached.data_warn),
+                (computed.acc, computed.acc_err, computed.data_warn))
+
+    def test_key_depends_on_version_and_content(self):
+        cache = Cache(self.db_name)
+        key = cache.key(b"dump")
+        self.assertNotEqual(key, cache.key(b"dump2"))
+        cache.put(key, RESULT)
+        cache.VERSION = "other"
+        self.assertNotEqual(cache.key(b"dump"), key)
+        self.assertIsNone(cache.get(cache.key(b"dump")))
+
+    def test_malformed_result_is_recomputed(self):
+        cache = Cache(self.db_name)
+        expected = Data()
+        expected.read_dump(self.dump_name, cache)
+        cache.db.execute("UPDATE results SET result = 'x'")
+        cache.db.commit()
+
+        data = Data()
+        data.read_dump(self.dump_name, cache)
+        self.assertEqual((data.acc, data.acc_err, data.data_warn),
+                (expected.acc, expected.acc_err, expected.data_warn))
+        self.assertNotEqual(cache.db.execute("SELECT result FROM results").fetchone()[0], "x")
+
+    def test_hit_refreshes_atime(self):
+        cache = Cache(self.db_name)
+        cache.put("k", RESULT)
+        cache.db.execute("UPDATE results SET atime = ?", (time.time() - 2 * cache.TOUCH_AGE,))
+        cache.db.commit()
+        cache.get("k")
+        atime = cache.db.execute("SELECT atime FROM results").fetchone()[0]
+        self.assertGreater(atime, time.time() - cache.TOUCH_AGE)
+
+    def test_evict_keeps_newest_entries(self):
+        cache = Cache(self.db_name, max_entries=5, max_age=10 ** 12)
+        cache.EVICT_EVERY = 3
+        for i in range(0, 20):
+            cache.put("k%d" % i, RESULT)
+            # distinct and ordered atimes, the row being inserted is always the newest
+            cache.db.execute("UPDATE results SET atime = ? WHERE key = ?", (i, "k%d" % i))
+            cache.db.commit()
+        # last eviction ran on the 18th insert and kept 5 rows, then 2 more were added
+        self.assertEqual(self.keys(cache), {"k%d" % i for i in range(13, 20)})
+
+    def test_evict_drops_old_entries(self):
+        cache = Cache(self.db_name, max_age=100)
+        cache.EVICT_EVERY = 2
+        cache.put("old", RESULT)
+        cache.db.execute("UPDATE results SET atime = ?", (time.time() - 1000,))
+        cache.db.commit()
+        cache.put("new", RESULT)
+        self.assertEqual(self.keys(cache), {"new"})
+
+    def test_corrupt_file_falls_back_to_recompute(self):
+        with open(self.db_name, "wb") as f:
+            f.write(os.urandom(4096))
+        cache = Cache(self.db_name)
+        self.assertIsNone(cache.get("k"))
+        cache.put("k", RESULT)
+
+        data = Data()
+        data.read_dump(self.dump_name, cache)
+        self.assertEqual(data.acc[0], ["000", "000", "000", "001"])
+
+    def test_locked_file_falls_back_to_recompute(self):
+        cache = Cache(self.db_name)
+        cache.put("k", RESULT)
+        cache.db.execute("PRAGMA busy_timeout = 0")
+        lock = sqlite3.connect(self.db_name)
+        self.addCleanup(lock.close)
+        lock.execute("BEGIN EXCLUSIVE")
+
+        self.assertIsNone(cache.get("k"))
+        data = Data()
+        data.read_dump(self.dump_name, cache)
+        self.assertEqual(data.acc[0], ["000", "000", "000", "001"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,193 @@
+import os
+import random
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from mfd.data import Data
+
+
+def sector_layout(size: int) -> list:
+    return [4] * 32 + [16] * 8 if size == 4096 else [4] * (size // 64)
+
+
+def make_dump(size: int) -> bytes:
+    dump = bytearray(size)
+    uid = bytes.fromhex("11223344")
+    dump[0:4] = uid
+    dump[4] = uid[0] ^ uid[1] ^ uid[2] ^ uid[3]
+    # transport configuration trailers: keys ff.., access bits ff078069
+    offset = 0
+    for blocks in sector_layout(size):
+        offset += blocks * 16
+        dump[offset - 16:offset] = bytes.fromhex("ffffffffffffff078069ffffffffffff")
+    return bytes(dump)
+
+
+def encode_acc(triples: list) -> bytes:
+    # bytes 6..8 of a trailer as laid out in the MIFARE Classic datasheet
+    b6 = b7 = b8 = 0
+    for i, (c1, c2, c3) in enumerate(triples):
+        b6 |= (1 - c1) << i | (1 - c2) << (4 + i)
+        b7 |= (1 - c3) << i | c1 << (4 + i)
+        b8 |= c2 << i | c3 << (4 + i)
+    return bytes([b6, b7, b8])
+
+
+def reference_acc(acc: bytes, i: int) -> str:
+    c1, c2, c3 = acc[1] >> (4 + i) & 1, acc[2] >> i & 1, acc[2] >> (4 + i) & 1
+    n1, n2, n3 = acc[0] >> i & 1, acc[0] >> (4 + i) & 1, acc[1] >> i & 1
+    if (c1, c2, c3) != (1 - n1, 1 - n2, 1 - n3):
+        return "ERR"
+    return "{}{}{}".format(c1, c2, c3)
+
+
+def reference_value_block(block: bytes) -> str:
+    value_ok = block[0:4] == bytes(x ^ 0xff for x in block[4:8]) == block[8:12]
+    addr_ok = block[12] == block[13] ^ 0xff == block[14] == block[15] ^ 0xff
+    return "OK" if value_ok and addr_ok else "WARN"
+
+
+class DataTestCase(unittest.TestCase):
+    def load(self, size: int, dump: bytes = None) -> Data:
+        f = tempfile.NamedTemporaryFile(suffix=".mfd", delete=False)
+        f.write(make_dump(size) if dump is None else dump)
+        f.close()
+        self.addCleanup(os.remove, f.name)
+        data = Data()
+        data.read_dump(f.name)
+        return data
+
+    def check_against_reference(self, data: Data, dump: bytes):
+        self.assertEqual("".join(["".join(sector) for sector in data.blocks]), dump.hex())
+        offset = 0
+        for s, blocks in enumerate(sector_layout(len(dump))):
+            acc = dump[offset + (blocks - 1) * 16 + 6:offset + (blocks - 1) * 16 + 9]
+            for b in range(0, blocks):
+                expected = reference_acc(acc, b if blocks == 4 else b // 5)
+                self.assertEqual(data.acc[s][b], expected)
+                self.assertEqual(data.acc_err[s][b], "ERR" if expected == "ERR" else "OK")
+                warn = "OK"
+                if b != blocks - 1 and (s, b) != (0, 0) and expected in ["000", "001", "110"]:
+                    warn = reference_value_block(dump[offset + b * 16:offset + b * 16 + 16])
+                self.assertEqual(data.data_warn[s][b], warn)
+            offset += blocks * 16
+
+    def test_known_access_bits(self):
+        expected = {
+            "ff078069": ["000", "000", "000", "001"],
+            "7f078869": ["000", "000", "000", "011"],
+            "08778f00": ["110", "110", "110", "011"],
+            "787788c1": ["100", "100", "100", "011"],
+            "00000000": ["ERR", "ERR", "ERR", "ERR"],
+        }
+        for acc, bits in expected.items():
+            dump = bytearray(make_dump(1024))
+            dump[64 + 48 + 6:64 + 48 + 10] = bytes.fromhex(acc)
+            data = self.load(1024, bytes(dump))
+            self.assertEqual(data.acc[1], bits, acc)
+            self.assertEqual(data.acc_err[1], ["ERR" if b == "ERR" else "OK" for b in bits], acc)
+
+    def test_access_bits_of_16_block_sector(self):
+        dump = bytearray(make_dump(4096))
+        trailer = 32 * 64 + 15 * 16
+        dump[trailer + 6:trailer + 9] = encode_acc([(0, 0, 0), (0, 1, 0), (1, 0, 0), (0, 1, 1)])
+        data = self.load(4096, bytes(dump))
+        self.assertEqual(data.acc[32], ["000"] * 5 + ["010"] * 5 + ["100"] * 5 + ["011"])
+
+    def test_value_block_check(self):
+        dump = bytearray(make_dump(1024))
+        dump[64:80] = bytes.fromhex("7856341287a9cbed7856341205fa05fa")
+        dump[80:96] = bytes.fromhex("7856341287a9cbed7856341305fa05fa")
+        data = self.load(1024, bytes(dump))
+        self.assertEqual(data.data_warn[1], ["OK", "WARN", "WARN", "OK"])
+        # read only data blocks are not checked as value blocks
+        dump[64 + 48 + 6:64 + 48 + 9] = encode_acc([(0, 1, 0)] * 3 + [(0, 0, 1)])
+        data = self.load(1024, bytes(dump))
+        self.assertEqual(data.data_warn[1], ["OK", "OK", "OK", "OK"])
+
+    def test_random_dumps_match_reference(self):
+        rng = random.Random(2024)
+        for _ in range(0, 300):
+            size = rng.choice([320, 1024, 4096])
+            dump = bytearray(rng.getrandbits(8) for _ in range(size))
+            offset = 0
+            for blocks in sector_layout(size):
+                # most trailers valid, so both decoding and value block checks get exercised
+                if rng.random() < 0.8:
+                    triples = [tuple(rng.getrandbits(1) for _ in range(3)) for _ in range(4)]
+                    dump[offset + (blocks - 1) * 16 + 6:offset + (blocks - 1) * 16 + 9] = encode_acc(triples)
+                if rng.random() < 0.3:
+                    dump[offset:offset + 16] = bytes.fromhex("7856341287a9cbed7856341205fa05fa")
+                offset += blocks * 16
+            self.check_against_reference(self.load(size, bytes(dump)), bytes(dump))
+
+    def test_random_edits_match_reference(self):
+        rng = random.Random(2025)
+        for size in [320, 1024, 4096]:
+            data = self.load(size)
+            for _ in range(0, 500):
+                s = rng.randrange(0, len(data.blocks))
+                b = rng.randrange(0, len(data.blocks[s]))
+                if rng.random() < 0.5 and len(data.blocks[s]) == 4 and data.acc[s][b] != "ERR":
+                    data.update_acc_bit(s, b, rng.randrange(0, 3), rng.choice("01"))
+                    # the edited bits have to be what the trailer now decodes to
+                    acc = bytes.fromhex(data.blocks[s][3][12:18])
+                    self.assertEqual(reference_acc(acc, b), data.acc[s][b])
+                else:
+                    data.update_blocks_hex(s, b, rng.randrange(0, 32), rng.choice("0123456789abcdef"))
+            data.save_dump()
+            with open(data.file_name, "rb") as f:
+                dump = f.read()
+            self.check_against_reference(data, dump)
+            self.check_against_reference(self.load(size, dump), dump)
+
+    def test_block_offset(self):
+        data = self.load(4096)
+        self.assertEqual(data.block_offset(0, 0), 0)
+        self.assertEqual(data.block_offset(1, 2), (4 + 2) * 32)
+        self.assertEqual(data.block_offset(32, 0), 32 * 4 * 32)
+        self.assertEqual(data.block_offset(33, 1), (32 * 4 + 16 + 1) * 32)
+
+    def test_write_hex_across_block_boundary(self):
+        data = self.load(1024)
+        data.write_hex(data.block_offset(1, 0) + 30, "abcd")
+        self.assertEqual(data.blocks[1][0][30:], "ab")
+        self.assertEqual(data.blocks[1][1][:2], "cd")
+        self.assertEqual(data.read_hex(data.block_offset(1, 0) + 30, data.block_offset(1, 1) + 2), "abcd")
+        self.assertTrue(data.edited)
+
+    def test_write_hex_clipped_at_end_of_dump(self):
+        data = self.load(1024)
+        end = data.block_offset(15, 3) + 32
+        data.write_hex(end - 2, "123456")
+        self.assertEqual(data.read_hex(end - 2, end), "12")
+        self.assertEqual(len(data.blocks), 16)
+        self.assertTrue(all(len(block) == 32 for sector in data.blocks for block in sector))
+
+    def test_write_hex_past_end_of_dump_is_ignored(self):
+        data = self.load(320)
+        data.write_hex(320 * 2, "ff")
+        self.assertFalse(data.edited)
+
+    def test_write_hex_over_uid_recomputes_bcc(self):
+        data = self.load(1024)
+        data.write_hex(0, "deadbeef")
+        self.assertEqual(data.blocks[0][0][0:10], "deadbeef22")
+
+    def test_write_hex_over_bcc_keeps_bcc_derived_from_uid(self):
+        data = self.load(1024)
+        data.write_hex(8, "00ff")
+        self.assertEqual(data.blocks[0][0][0:12], "1122334444ff")
+
+    def test_write_hex_revalidates_access_bits(self):
+        data = self.load(1024)
+        data.write_hex(data.block_offset(2, 3) + 12, "00000000")
+        self.assertEqual(data.acc_err[2], ["ERR"] * 4)
+        self.assertEqual(data.acc_err[3], ["OK"] * 4)
+
+
+if __name__ == "__main__":
+    unittest.main()